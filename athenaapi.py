@@ -1,154 +1,259 @@
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
 import streamlit as st
+import json
 import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from operator import methodcaller
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON decoding when installed
+    orjson = None
+
+# Both decoders take the raw UTF-8 body, skipping requests' text decoding
+# and charset detection.
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 st.set_page_config(layout="wide")
 
 VALID_USERNAME = os.getenv("VALID_USERNAME")
 VALID_PASSWORD = os.getenv("VALID_PASSWORD")
 
+FETCH_WORKERS = 10
+TOKEN_TTL = 3300
+
 
 # ---------------------------
 # Utility functions
 # ---------------------------
 
-def get_token(client_id: str, client_secret: str, token_url: str) -> str:
+@st.cache_resource
+def _http() -> requests.Session:
+    session = requests.Session()
+    session.headers.update({"Accept": "application/json"})
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_resource
+def _token_prefetch_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=1)
+
+
+@st.cache_resource(ttl=TOKEN_TTL, show_spinner=False)
+def _request_token(client_id: str, client_secret: str, token_url: str) -> dict:
     headers = {"Content-Type": "application/x-www-form-urlencoded"}
     data = {"grant_type": "client_credentials"}
     auth = HTTPBasicAuth(client_id, client_secret)
 
-    resp = requests.post(token_url, headers=headers, data=data, auth=auth, timeout=60)
+    resp = _http().post(token_url, headers=headers, data=data, auth=auth, timeout=60)
     resp.raise_for_status()
-    payload = resp.json()
+    payload = _json_loads(resp.content)
     if "access_token" not in payload:
         raise RuntimeError(f"Unexpected token response: {payload}")
-    return payload["access_token"]
 
+    expires_in = payload.get("expires_in")
+    ttl = max(60, int(expires_in) - 60) if expires_in else TOKEN_TTL
+    return {"access_token": payload["access_token"], "expiry": time.monotonic() + ttl}
 
-def get_details(url: str, token: str) -> object:
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/json",
-    }
-    resp = requests.get(url, headers=headers, timeout=60)
-    resp.raise_for_status()
-    return resp.json()
 
+def get_token(client_id: str, client_secret: str, token_url: str) -> str:
+    cached = _request_token(client_id, client_secret, token_url)
+    if time.monotonic() > cached["expiry"]:
+        _request_token.clear()
+        cached = _request_token(client_id, client_secret, token_url)
+    return cached["access_token"]
 
-def flatten_all_json(raw_json: object, sep: str = "_") -> pd.DataFrame:
-    if raw_json is None:
-        return pd.DataFrame()
 
-    df = pd.json_normalize(raw_json, sep=sep)
+def invalidate_token():
+    _request_token.clear()
 
-    while True:
-        list_cols = [
-            col for col in df.columns
-            if df[col].apply(lambda x: isinstance(x, list)).any()
-        ]
-        if not list_cols:
-            break
 
-        for col in list_cols:
-            df = df.explode(col).reset_index(drop=True)
-            df = pd.json_normalize(df.to_dict(orient="records"), sep=sep)
+def get_details(url: str, token: str) -> object:
+    headers = {"Authorization": f"Bearer {token}"}
+    resp = _http().get(url, headers=headers, timeout=60)
+    resp.raise_for_status()
+    return _json_loads(resp.content)
+
+
+@st.cache_data(ttl=300, show_spinner=False, max_entries=512)
+def cached_get_details(url: str, _token: str) -> object:
+    # The leading underscore keeps the token out of the cache key, so a
+    # token refresh doesn't throw away responses that are still fresh.
+    return get_details(url, _token)
+
+
+def _flatten_rows(obj: object, prefix: str, sep: str) -> list:
+    # Lists fan out into one row per element, sibling lists combine as a
+    # cross product, and empty lists become a null cell.
+    if isinstance(obj, dict):
+        rows = [{}]
+        for k, v in obj.items():
+            key = f"{prefix}{sep}{k}" if prefix else str(k)
+            if not isinstance(v, (dict, list)):
+                # Scalars can't fan out: set them in place instead of recursing.
+                for row in rows:
+                    row[key] = v
+                continue
+            subs = _flatten_rows(v, key, sep)
+            if len(subs) == 1:
+                # Nested dicts without lists: merge into the existing rows.
+                for row in rows:
+                    row.update(subs[0])
+            else:
+                rows = [{**row, **sub} for row in rows for sub in subs]
+        return rows
+    if isinstance(obj, list):
+        if not obj:
+            return [{prefix: None}] if prefix else []
+        return [row for item in obj for row in _flatten_rows(item, prefix, sep)]
+    return [{prefix: obj}]
 
-    return df
 
+def flatten_all_json(raw_json: object, sep: str = "_") -> pd.DataFrame:
+    if raw_json is None:
+        return pd.DataFrame()
 
-def _f(x):
-    try:
-        return float(x) if x is not None else None
-    except Exception:
-        return None
+    return pd.DataFrame(_flatten_rows(raw_json, "", sep))
 
 
 # ---------------------------
 # Pricing parsers
 # ---------------------------
 
-def parse_completion_design_items(raw, project_number, well_id) -> pd.DataFrame:
-    rows = []
-    designs = raw if isinstance(raw, list) else []
-    for d in designs:
-        proppants = d.get("proppantsTypeMesh", []) if isinstance(d, dict) else []
-        for p in proppants:
-            rows.append({
-                "project_number": project_number,
-                "well_id": str(well_id),
-                "source": "completionDesign",
-                "item_code": p.get("proppantSizeCatalogExternal"),
-                "name": p.get("proppantCommercialName"),
-                "uom": p.get("unit"),
-                "unit_price": _f(p.get("unitPrice")),
-                "discount_percentage": _f(p.get("discountPercentage")),
-                "discounted_unit_price": _f(p.get("discountedUnitPrice")),
-                "quantity": _f(p.get("quotedQuantity")),
-            })
-    return pd.DataFrame(rows)
-
-
-def parse_frac_chemicals_items(raw, project_number, well_id) -> pd.DataFrame:
-    rows = []
-    groups = raw if isinstance(raw, list) else []
-    for grp in groups:
-        chem_types = grp.get("chemTypes", []) if isinstance(grp, dict) else []
-        for ch in chem_types:
-            rows.append({
-                "project_number": project_number,
-                "well_id": str(well_id),
-                "source": "fracChemicals",
-                "item_code": ch.get("chemicalTypeCatalogExternal"),
-                "name": ch.get("commercialName"),
-                "uom": ch.get("unit"),
-                "unit_price": _f(ch.get("unitPrice")),
-                "discount_percentage": _f(ch.get("discount")),
-                "discounted_unit_price": _f(ch.get("discountedUnitPrice")),
-                "quantity": _f(ch.get("quotedQuantity")),
-            })
-    return pd.DataFrame(rows)
-
-
-def parse_cartage_charges_items(raw, project_number, well_id) -> pd.DataFrame:
-    rows = []
-    items = raw if isinstance(raw, list) else []
-    for it in items:
-        mu = it.get("measurementUnits") if isinstance(it, dict) else {}
-        rows.append({
-            "project_number": project_number,
-            "well_id": str(well_id),
-            "source": "cartageCharges",
-            "item_code": it.get("cartageChargeCatalogExternal"),
-            "name": it.get("itemDescription"),
-            "uom": (mu or {}).get("label"),
-            "unit_price": _f(it.get("unitPrice")),
-            "discount_percentage": _f(it.get("discountPercentage")),
-            "discounted_unit_price": _f(it.get("discountedUnitPrice")),
-            "quantity": _f(it.get("quotedQuantity")),
-        })
-    return pd.DataFrame(rows)
-
-
-def parse_service_charges_items(raw, project_number, well_id) -> pd.DataFrame:
-    rows = []
-    items = raw if isinstance(raw, list) else []
-    for it in items:
-        mu = it.get("measurementUnits") if isinstance(it, dict) else {}
-        rows.append({
-            "project_number": project_number,
-            "well_id": str(well_id),
-            "source": "serviceCharges",
-            "item_code": it.get("serviceChargeCatalogExternal"),
-            "name": it.get("itemDescription"),
-            "uom": (mu or {}).get("label"),
-            "unit_price": _f(it.get("unitPrice")),
-            "discount_percentage": _f(it.get("discountPercentage")),
-            "discounted_unit_price": _f(it.get("discountedUnitPrice")),
-            "quantity": _f(it.get("quotedQuantity")),
-        })
-    return pd.DataFrame(rows)
+PRICING_COLS = (
+    "project_number", "well_id", "source",
+    "item_code", "name", "uom",
+    "unit_price", "discount_percentage", "discounted_unit_price", "quantity",
+)
+
+ITEM_COLS = (
+    "project_number", "well_id", "well_name", "source",
+    "item_code", "name", "uom",
+    "unit_price", "discount_percentage", "discounted_unit_price",
+    "quantity", "extended_discounted", "extended_list",
+)
+
+# Low-cardinality text columns, stored as categoricals (integer codes).
+ITEM_CATEGORY_COLS = ("project_number", "well_id", "well_name", "source", "uom")
+# Free-text columns, stored Arrow-backed when every value is already a str
+# (streamlit already ships pyarrow).
+ITEM_STRING_COLS = ("item_code", "name")
+
+PRICING_DTYPES = {
+    "unit_price": "float64",
+    "discount_percentage": "float64",
+    "discounted_unit_price": "float64",
+    "quantity": "float64",
+}
+
+# Per-source layout of the pricing payloads: "path" lists the nested keys
+# to descend through to reach the line items, "map" gives the JSON key (or
+# key path) feeding each pricing column.
+_PRICING_SCHEMAS = {
+    "completionDesign": {
+        "path": ("proppantsTypeMesh",),
+        "map": {
+            "item_code": "proppantSizeCatalogExternal",
+            "name": "proppantCommercialName",
+            "uom": "unit",
+            "unit_price": "unitPrice",
+            "discount_percentage": "discountPercentage",
+            "discounted_unit_price": "discountedUnitPrice",
+            "quantity": "quotedQuantity",
+        },
+    },
+    "fracChemicals": {
+        "path": ("chemTypes",),
+        "map": {
+            "item_code": "chemicalTypeCatalogExternal",
+            "name": "commercialName",
+            "uom": "unit",
+            "unit_price": "unitPrice",
+            "discount_percentage": "discount",
+            "discounted_unit_price": "discountedUnitPrice",
+            "quantity": "quotedQuantity",
+        },
+    },
+    "cartageCharges": {
+        "path": (),
+        "map": {
+            "item_code": "cartageChargeCatalogExternal",
+            "name": "itemDescription",
+            "uom": ("measurementUnits", "label"),
+            "unit_price": "unitPrice",
+            "discount_percentage": "discountPercentage",
+            "discounted_unit_price": "discountedUnitPrice",
+            "quantity": "quotedQuantity",
+        },
+    },
+    "serviceCharges": {
+        "path": (),
+        "map": {
+            "item_code": "serviceChargeCatalogExternal",
+            "name": "itemDescription",
+            "uom": ("measurementUnits", "label"),
+            "unit_price": "unitPrice",
+            "discount_percentage": "discountPercentage",
+            "discounted_unit_price": "discountedUnitPrice",
+            "quantity": "quotedQuantity",
+        },
+    },
+}
+
+
+def _field_getter(key):
+    if isinstance(key, tuple):
+        def get(item):
+            for k in key:
+                item = item.get(k) if isinstance(item, dict) else None
+            return item
+        return get
+    return methodcaller("get", key)
+
+
+# Compiled once at import: per source, one getter per item column, in
+# PRICING_COLS order.
+_PRICING_GETTERS = {
+    source: tuple(_field_getter(schema["map"][c]) for c in PRICING_COLS[3:])
+    for source, schema in _PRICING_SCHEMAS.items()
+}
+
+
+def _iter_pricing_items(raw: list, path):
+    items = raw
+    for key in path:
+        items = [child for it in items if isinstance(it, dict) for child in (it.get(key) or [])]
+    return [it for it in items if isinstance(it, dict)]
+
+
+def extract_pricing(raw, source, project_number, well_id: str, cols_out: dict) -> None:
+    # Most wells have nothing for most sources; skip those outright.
+    if not isinstance(raw, list) or not raw:
+        return
+    items = _iter_pricing_items(raw, _PRICING_SCHEMAS[source]["path"])
+    n = len(items)
+    if not n:
+        return
+
+    # Per-call constants are extended in one go; only the item fields vary per row.
+    cols_out["project_number"].extend([project_number] * n)
+    cols_out["well_id"].extend([well_id] * n)
+    cols_out["source"].extend([source] * n)
+    for c, get in zip(PRICING_COLS[3:], _PRICING_GETTERS[source]):
+        cols_out[c].extend(map(get, items))
 
 
 # ---------------------------
@@ -167,79 +272,118 @@ def extract_well_name(raw_general_well_info) -> str:
 # Project extraction
 # ---------------------------
 
+# Every attribute fetched per well: the general info (for the well name)
+# plus one per pricing source, dispatched through _PRICING_SCHEMAS.
+WELL_ATTRIBUTES = ("generalWellInformation", *_PRICING_SCHEMAS)
+
+
+@st.cache_data(ttl=300, show_spinner=False, max_entries=64)
 def build_project_dataset(project_number: str, token: str, base_url: str):
     project_url = f"{base_url}/project/?project_number={project_number}"
-    raw_project = get_details(project_url, token)
+    raw_project = cached_get_details(project_url, token)
     df_project = pd.json_normalize(raw_project, sep="_")
 
-    if "wellIDs" in df_project.columns:
-        df_exploded = df_project[["wellIDs"]].explode("wellIDs").reset_index(drop=True)
-        df_wells = pd.json_normalize(df_exploded["wellIDs"])
-    else:
-        df_wells = pd.DataFrame()
-
-    debug_attributes = [
-        "generalWellInformation",
-        "completionDesign",
-        "fracChemicals",
-        "cartageCharges",
-        "serviceCharges",
+    projects = raw_project if isinstance(raw_project, list) else [raw_project]
+    wells = [
+        w for p in projects if isinstance(p, dict)
+        for w in (p.get("wellIDs") or []) if isinstance(w, dict)
     ]
+    df_wells = pd.DataFrame(wells)
 
-    pricing_frames = []
+    pricing_cols = {c: [] for c in PRICING_COLS}
     well_id_to_name = {}
     raw_by_well = {}
 
-    if not df_wells.empty and "id" in df_wells.columns:
-        for wid in df_wells["id"].dropna().unique():
-            wid = str(wid)
-            raw_by_well[wid] = {}
-
-            for att in debug_attributes:
-                api_url = f"{base_url}/{att}?well_id={wid}"
-                raw = get_details(api_url, token)
-                raw_by_well[wid][att] = raw
+    well_ids = tuple(dict.fromkeys(str(w["id"]) for w in wells if w.get("id") is not None))
+    if well_ids:
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as ex:
+            futures = {
+                (wid, att): ex.submit(cached_get_details, f"{base_url}/{att}?well_id={wid}", token)
+                for wid in well_ids
+                for att in WELL_ATTRIBUTES
+            }
+
+            # Consume in submission order so the output is stable; early
+            # responses are parsed while later requests are still in flight.
+            for (wid, att), fut in futures.items():
+                raw = fut.result()
+                raw_by_well.setdefault(wid, {})[att] = raw
 
                 if att == "generalWellInformation":
                     well_id_to_name[wid] = extract_well_name(raw)
 
-                if att == "completionDesign":
-                    pricing_frames.append(parse_completion_design_items(raw, project_number, wid))
-                elif att == "fracChemicals":
-                    pricing_frames.append(parse_frac_chemicals_items(raw, project_number, wid))
-                elif att == "cartageCharges":
-                    pricing_frames.append(parse_cartage_charges_items(raw, project_number, wid))
-                elif att == "serviceCharges":
-                    pricing_frames.append(parse_service_charges_items(raw, project_number, wid))
-
-    df_items = (
-        pd.concat([x for x in pricing_frames if x is not None and not x.empty], ignore_index=True)
-        if pricing_frames else pd.DataFrame()
-    )
-
-    if not df_items.empty:
-        df_items["well_name"] = df_items["well_id"].map(well_id_to_name)
-        df_items["extended_discounted"] = df_items["discounted_unit_price"].fillna(0) * df_items["quantity"].fillna(0)
-        df_items["extended_list"] = df_items["unit_price"].fillna(0) * df_items["quantity"].fillna(0)
-
-        col_order = [
-            "project_number", "well_id", "well_name", "source",
-            "item_code", "name", "uom",
-            "unit_price", "discount_percentage", "discounted_unit_price",
-            "quantity", "extended_discounted", "extended_list"
-        ]
-        df_items = df_items[[c for c in col_order if c in df_items.columns]]
+                if att in _PRICING_SCHEMAS:
+                    extract_pricing(raw, att, project_number, wid, pricing_cols)
+
+    if pricing_cols["source"]:
+        # Finish every column on the lists/arrays first, then build the frame
+        # once, already in display order.
+        for c, dtype in PRICING_DTYPES.items():
+            pricing_cols[c] = pd.to_numeric(pricing_cols[c], errors="coerce").astype(dtype, copy=False)
+        qty = np.nan_to_num(pricing_cols["quantity"])
+        pricing_cols["well_name"] = [well_id_to_name.get(wid) for wid in pricing_cols["well_id"]]
+        pricing_cols["extended_discounted"] = np.nan_to_num(pricing_cols["discounted_unit_price"]) * qty
+        pricing_cols["extended_list"] = np.nan_to_num(pricing_cols["unit_price"]) * qty
+        for c in ITEM_CATEGORY_COLS:
+            pricing_cols[c] = pd.Categorical(pricing_cols[c])
+        for c in ITEM_STRING_COLS:
+            # Only when it's lossless: numeric codes must not turn into strings.
+            if all(v is None or isinstance(v, str) for v in pricing_cols[c]):
+                pricing_cols[c] = pd.array(pricing_cols[c], dtype="string[pyarrow]")
+        df_items = pd.DataFrame({c: pricing_cols[c] for c in ITEM_COLS}, copy=False)
+
+        # Aggregate once per load so redraws don't regroup the items.
+        df_summary = (
+            df_items
+            .groupby(["well_id", "well_name", "source"], as_index=False, sort=False, observed=True)
+            .agg(
+                lines=("item_code", "size"),
+                total_qty=("quantity", "sum"),
+                total_discounted=("extended_discounted", "sum"),
+                total_list=("extended_list", "sum"),
+            )
+        )
+    else:
+        df_items = pd.DataFrame()
+        df_summary = pd.DataFrame()
 
     return {
         "raw_project": raw_project,
         "df_project": df_project,
         "df_wells": df_wells,
         "df_items": df_items,
+        "df_summary": df_summary,
         "well_id_to_name": well_id_to_name,
         "raw_by_well": raw_by_well,
     }
 
 
+def build_project_datasets(project_numbers: list, token: str, base_url: str) -> list:
+    if len(project_numbers) == 1:
+        return [build_project_dataset(project_numbers[0], token, base_url)]
+    # Each project fans out its own well requests; run the projects side by side too.
+    with ThreadPoolExecutor(max_workers=len(project_numbers)) as ex:
+        return list(ex.map(lambda pn: build_project_dataset(pn, token, base_url), project_numbers))
+
+
+def load_projects(project_numbers: list, base_url: str, client_id: str, client_secret: str, token_url: str,
+                  token_future: Future | None = None) -> list:
+    if token_future is not None:
+        # Let an in-flight prefetch finish first; get_token then reads the warm
+        # cache, or fetches inline and surfaces the error if the prefetch failed.
+        wait([token_future])
+    token = get_token(client_id, client_secret, token_url)
+    try:
+        return build_project_datasets(project_numbers, token, base_url)
+    except requests.HTTPError as e:
+        if e.response is None or e.response.status_code != 401:
+            raise
+        # Token was revoked or expired early; fetch a fresh one and retry once.
+        invalidate_token()
+        token = get_token(client_id, client_secret, token_url)
+        return build_project_datasets(project_numbers, token, base_url)
+
+
 # ---------------------------
 # Comparison helpers
 # ---------------------------
@@ -262,6 +406,8 @@ def normalize_compare_df(df: pd.DataFrame) -> pd.DataFrame:
     out = df[existing_cols].copy()
 
     for col in out.columns:
+        if isinstance(out[col].dtype, (pd.CategoricalDtype, pd.StringDtype)):
+            out[col] = out[col].astype(object)
         if out[col].dtype == "object":
             out[col] = out[col].fillna("").astype(str).str.strip()
         else:
@@ -361,28 +507,44 @@ def login():
 # UI Renderers
 # ---------------------------
 
+def project_fields_df(df_project: pd.DataFrame) -> pd.DataFrame:
+    # Field/value table with one value column per project record; nulls kept.
+    if df_project.empty:
+        return pd.DataFrame(columns=["field", "value"])
+
+    rows = df_project.to_numpy(dtype=object)
+    present = df_project.notna().to_numpy()
+    names = ["value"] if len(rows) == 1 else [f"value_{i + 1}" for i in range(len(rows))]
+
+    data = {"field": df_project.columns}
+    for name, row, mask in zip(names, rows, present):
+        data[name] = [str(v) if p else None for v, p in zip(row, mask)]
+    return pd.DataFrame(data)
+
+
 def render_single_project(project_data, project_number):
     st.subheader(f"Project Details: {project_number}")
+    show_debug = st.sidebar.checkbox("Show debug tables", value=False)
 
-    st.write("Raw Project JSON:")
-    st.write(project_data["raw_project"])
+    if show_debug:
+        st.write("Raw Project JSON:")
+        st.write(project_data["raw_project"])
 
     st.write("Project Details:")
-    st.dataframe(project_data["df_project"].T)
+    st.dataframe(project_fields_df(project_data["df_project"]), hide_index=True)
 
     st.write("Well IDs:")
     st.dataframe(project_data["df_wells"])
 
-    st.subheader("Well Attribute Details")
-    raw_by_well = project_data["raw_by_well"]
+    if show_debug:
+        st.subheader("Well Attribute Details")
+        raw_by_well = project_data["raw_by_well"]
 
-    for wid, attrs in raw_by_well.items():
-        with st.expander(f"Well ID: {wid}", expanded=False):
+        for wid, attrs in raw_by_well.items():
             for att, raw in attrs.items():
-                st.markdown(f"**{att}**")
-                st.write(raw)
-                df_flat = flatten_all_json(raw)
-                st.dataframe(df_flat)
+                with st.expander(f"Debug {wid} / {att}", expanded=False):
+                    st.write(raw)
+                    st.dataframe(flatten_all_json(raw).head(100))
 
     df_items = project_data["df_items"]
 
@@ -391,17 +553,7 @@ def render_single_project(project_data, project_number):
         st.dataframe(df_items, use_container_width=True)
 
         st.subheader("Totals by Well + Source")
-        df_summary = (
-            df_items
-            .groupby(["well_id", "well_name", "source"], as_index=False)
-            .agg(
-                lines=("item_code", "size"),
-                total_qty=("quantity", "sum"),
-                total_discounted=("extended_discounted", "sum"),
-                total_list=("extended_list", "sum"),
-            )
-        )
-        st.dataframe(df_summary, use_container_width=True)
+        st.dataframe(project_data["df_summary"], use_container_width=True)
     else:
         st.info("No pricing items found (all pricing arrays empty).")
 
@@ -413,13 +565,13 @@ def render_compare_projects(project1, project2, data1, data2):
 
     with col1:
         st.markdown(f"### Project {project1}")
-        st.dataframe(data1["df_project"].T, use_container_width=True)
+        st.dataframe(project_fields_df(data1["df_project"]), use_container_width=True, hide_index=True)
         st.markdown("**Well IDs**")
         st.dataframe(data1["df_wells"], use_container_width=True)
 
     with col2:
         st.markdown(f"### Project {project2}")
-        st.dataframe(data2["df_project"].T, use_container_width=True)
+        st.dataframe(project_fields_df(data2["df_project"]), use_container_width=True, hide_index=True)
         st.markdown("**Well IDs**")
         st.dataframe(data2["df_wells"], use_container_width=True)
 
@@ -462,10 +614,22 @@ def main_app():
 
     st.title("Project & Well Details")
 
+    if st.sidebar.button("Refresh"):
+        cached_get_details.clear()
+        build_project_dataset.clear()
+        st.session_state.pop("loaded_project", None)
+        st.session_state.pop("loaded_compare", None)
+
     if not client_id or not client_secret:
         st.error("Missing env vars: client_id and/or client_secret")
         st.stop()
 
+    # Warm the token once per session so the first load overlaps with
+    # rendering and user input; later reruns don't resubmit.
+    if "token_prefetch" not in st.session_state:
+        st.session_state.token_prefetch = _token_prefetch_pool().submit(get_token, client_id, client_secret, token_url)
+    token_future = st.session_state.token_prefetch
+
     mode = st.radio(
         "Select Mode",
         ["Single Project", "Compare Projects"],
@@ -473,25 +637,38 @@ def main_app():
     )
 
     try:
-        token = get_token(client_id, client_secret, token_url)
-
         if mode == "Single Project":
-            project_number = st.text_input("Enter Project Number")
+            with st.form("project_form"):
+                project_number = st.text_input("Enter Project Number")
+                submitted = st.form_submit_button("Load")
+
+            # Only hit the API on submit; other reruns redraw the last load.
+            if submitted and project_number:
+                st.session_state.project_data = load_projects(
+                    [project_number], base_url, client_id, client_secret, token_url, token_future
+                )[0]
+                st.session_state.loaded_project = project_number
 
-            if project_number:
-                project_data = build_project_dataset(project_number, token, base_url)
-                render_single_project(project_data, project_number)
+            if project_number and st.session_state.get("loaded_project") == project_number:
+                render_single_project(st.session_state.project_data, project_number)
 
         else:
-            col1, col2 = st.columns(2)
-            with col1:
-                project1 = st.text_input("Enter Project Number 1")
-            with col2:
-                project2 = st.text_input("Enter Project Number 2")
-
-            if project1 and project2:
-                data1 = build_project_dataset(project1, token, base_url)
-                data2 = build_project_dataset(project2, token, base_url)
+            with st.form("compare_form"):
+                col1, col2 = st.columns(2)
+                with col1:
+                    project1 = st.text_input("Enter Project Number 1")
+                with col2:
+                    project2 = st.text_input("Enter Project Number 2")
+                submitted = st.form_submit_button("Compare")
+
+            if submitted and project1 and project2:
+                st.session_state.compare_data = tuple(
+                    load_projects([project1, project2], base_url, client_id, client_secret, token_url, token_future)
+                )
+                st.session_state.loaded_compare = (project1, project2)
+
+            if project1 and project2 and st.session_state.get("loaded_compare") == (project1, project2):
+                data1, data2 = st.session_state.compare_data
                 render_compare_projects(project1, project2, data1, data2)
 
     except Exception as e: